@@ -1,13 +1,79 @@
 #!/usr/bin/env python3
 
 import argparse
+import io
+import mmap
+import os
 import re
 import gzip
 import zipfile
 import statistics
 import sys
+import tempfile
+import heapq
+import shutil
+import subprocess
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from collections import Counter
+from collections import Counter, deque
+
+# Optional regex engines for the regex command
+try:
+    import re2  # google-re2: linear-time DFA matching
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan  # Intel Hyperscan: compiled multi-line scanning
+except ImportError:
+    hyperscan = None
+
+# Optional 128-bit hashing for compact duplicate detection
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Optional Aho-Corasick automaton for multi-keyword matching
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Read size for the binary fast path (8 MiB)
+CHUNK_SIZE = 1 << 23
+# Buffer size for buffered file objects (1 MiB instead of the 8 KiB default)
+OPEN_BUFFERING = 1 << 20
+# merge --low-memory: target size of one in-memory bucket and limit on open bucket files
+# (a bucket of short lines costs about 10x its size once loaded as bytes objects plus a set)
+BUCKET_SIZE = 1 << 24
+MAX_BUCKETS = 512
+# merge --low-memory: RAM shared by all buckets before they spill to temporary files
+SPOOL_BUDGET = 1 << 26
+# ASCII digits, for lines where str.isdigit() can't apply to anything else
+ASCII_DIGIT = re.compile('[0-9]')
+# stats on ASCII text: each matches once, as an empty string, at the start of a qualifying line
+LINES_WITH_NUMBER = re.compile(rb'(?m)^(?=[^\n0-9]*[0-9])')
+LINES_WITH_UPPER = re.compile(rb'(?m)^(?=[^\nA-Z]*[A-Z])')
+LINES_WITH_SPECIAL = re.compile(rb'(?m)^(?![A-Za-z0-9]+$)')
+# Sort position of non-numeric lines under --sort numeric
+INFINITY = float('inf')
+# Match-to-line ratio (1 in N) below which buffer searches jump from match to match
+SPARSE_MATCHES = 8
+# Lines per write() call when streaming output
+WRITE_BATCH = 1 << 16
+
+# Duplicate detection keeps 128-bit fingerprints instead of whole lines when xxhash is
+# available (collisions stay negligible even at 10^12 lines); otherwise the key is the
+# line itself, since a 64-bit hash would drop distinct lines at billion-line scale.
+# A fingerprint is a 44-byte int and a line a bytes object of 33 bytes plus its length,
+# so fingerprints only save memory on lines longer than about 11 bytes.
+# bytes() returns a bytes argument unchanged, without copying it.
+fingerprint = xxhash.xxh3_128_intdigest if xxhash is not None else bytes
 
 # Beautiful ASCII Art for WordCrunch
 def print_banner():
@@ -38,57 +104,565 @@ def progress_bar(current, total, width=50):
     bar = '█' * filled + '-' * (width - filled)
     return f'\r|{bar}| {percent:.1f}% ({current}/{total})'
 
+def open_sequential(filename, buffering=-1):
+    """Open a file for reading front to back, asking the OS for aggressive read-ahead"""
+    f = open(filename, 'rb', buffering=buffering)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Advice is optional; some file systems and special files refuse it
+    return f
+
+def advise_sequential(mm):
+    """Tell the OS a mapping will be read front to back"""
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
 def read_file_lines(filename, show_progress=False):
-    """Read lines from various file formats with optional progress"""
-    lines = []
+    """Iterate over lines of various file formats with optional progress"""
     path = Path(filename)
     
     if not path.exists():
         raise FileNotFoundError(f"File not found: {filename}")
     
+    return chain.from_iterable(read_line_batches(filename, show_progress))
+
+def read_line_batches(filename, show_progress=False):
+    """Yield lists of lines, one batch (1-8 MiB of input) at a time, from various file formats"""
     # Determine file type and read accordingly
     if filename.endswith('.gz'):
-        with gzip.open(filename, 'rt', encoding='utf-8', errors='ignore') as f:
+        raw = io.BufferedReader(gzip.open(filename, 'rb'), buffer_size=OPEN_BUFFERING)
+        with io.TextIOWrapper(raw, encoding='utf-8', errors='surrogateescape') as f:
             if show_progress:
                 # For compressed files, we can't easily show progress
                 print(f"Reading compressed file: {filename}")
-            lines = [line.rstrip('\n\r') for line in f]
+            for batch in iter(lambda: f.readlines(OPEN_BUFFERING), []):
+                yield [line.rstrip('\n') for line in batch]
+    elif filename.endswith('.zip'):
+        # Decode one newline-aligned buffer at a time
+        for buf in iter_line_buffers(filename):
+            yield buf.decode('utf-8', errors='surrogateescape').split('\n')
+    else:
+        raw = open_sequential(filename, OPEN_BUFFERING)
+        with io.TextIOWrapper(raw, encoding='utf-8', errors='surrogateescape') as f:
+            file_size = os.fstat(raw.fileno()).st_size
+            # Sample progress once per batch of lines; tell() on the text layer is slow
+            for batch in iter(lambda: f.readlines(OPEN_BUFFERING), []):
+                yield [line.rstrip('\n') for line in batch]
+                if show_progress:
+                    print(progress_bar(raw.tell(), file_size), end='', flush=True)
+            if show_progress:
+                print()  # New line after progress
+
+def iter_chunks(filename, chunk_size=CHUNK_SIZE, show_progress=False):
+    """Yield raw byte chunks from various file formats with optional progress"""
+    if not Path(filename).exists():
+        raise FileNotFoundError(f"File not found: {filename}")
+    
+    if filename.endswith('.gz'):
+        if show_progress:
+            print(f"Reading compressed file: {filename}")
+        with gzip.open(filename, 'rb') as f:
+            yield from iter(lambda: f.read(chunk_size), b'')
     elif filename.endswith('.zip'):
         with zipfile.ZipFile(filename, 'r') as zf:
             for file_info in zf.filelist:
                 if file_info.filename.endswith('.txt'):
                     with zf.open(file_info) as f:
-                        content = f.read().decode('utf-8', errors='ignore')
-                        lines.extend([line.rstrip('\n\r') for line in content.splitlines()])
+                        yield from iter(lambda: f.read(chunk_size), b'')
                     break
     else:
-        with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-            if show_progress:
-                # Get file size for progress
-                f.seek(0, 2)
-                file_size = f.tell()
-                f.seek(0)
-                
-                for i, line in enumerate(f):
-                    lines.append(line.rstrip('\n\r'))
-                    if i % 10000 == 0:
-                        pos = f.tell()
-                        print(progress_bar(pos, file_size), end='', flush=True)
-                print()  # New line after progress
+        file_size = os.path.getsize(filename)
+        pos = 0
+        with open_sequential(filename) as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                yield chunk
+                if show_progress:
+                    pos += len(chunk)
+                    print(progress_bar(pos, file_size), end='', flush=True)
+        if show_progress:
+            print()  # New line after progress
+
+def iter_line_buffers(filename, show_progress=False):
+    """Yield newline-aligned byte buffers, each holding one or more complete LF-separated lines"""
+    return map(normalize_newlines, align_lines(iter_chunks(filename, show_progress=show_progress)))
+
+def align_lines(chunks):
+    """Regroup raw byte chunks into buffers of complete lines, without the final newline"""
+    tail = b''
+    for chunk in chunks:
+        buf = tail + chunk
+        cut = buf.rfind(b'\n')
+        if cut >= 0:
+            tail = buf[cut + 1:]
+            yield buf[:cut]
+            continue
+        # Old Mac files only end lines with a lone \r; it stays in the buffer, which then ends
+        # with a line ending like a final \r\n does. A \r at the very end may still start a \r\n.
+        cut = buf.rfind(b'\r', 0, len(buf) - 1) + 1
+        tail = buf[cut:]
+        if cut:
+            yield buf[:cut]
+    if tail:
+        yield tail
+
+def normalize_newlines(buf):
+    """Turn the CRLF and lone CR line endings of a line buffer into LF, as universal newlines do"""
+    if b'\r' not in buf:
+        return buf
+    if buf.endswith(b'\r'):
+        buf = buf[:-1]  # The last line's own ending, or the CR of a CRLF whose LF was cut off
+    return buf.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+def split_lines(buf):
+    """Split a line buffer into raw byte lines without line endings"""
+    return normalize_newlines(buf).split(b'\n')
+
+def iter_lines_bytes(filename, show_progress=False):
+    """Iterate over raw byte lines of a file without decoding them"""
+    if not Path(filename).exists():
+        raise FileNotFoundError(f"File not found: {filename}")
+    return chain.from_iterable(map(split_lines, iter_line_buffers(filename, show_progress)))
+
+class LineSet:
+    """Lines of a file packed into one bytes blob, indexed by offset and length arrays
+
+    Line i is data[offsets[i]:offsets[i + 1] - 1]; lengths[i] is its length in characters.
+    """
+    
+    def __init__(self, data, offsets, lengths):
+        self.data = data
+        self.offsets = offsets
+        self.lengths = lengths
+    
+    @classmethod
+    def from_file(cls, filename, show_progress=False):
+        """Pack the lines of a file, decoded the same way read_file_lines() decodes them"""
+        if not Path(filename).exists():
+            raise FileNotFoundError(f"File not found: {filename}")
+        
+        data = bytearray()
+        offsets = array('q', [0])
+        lengths = array('q')
+        offset = 0
+        for buf in iter_line_buffers(filename, show_progress):
+            lines = split_lines(buf)
+            data += b'\n'.join(lines)
+            data += b'\n'
+            for line in lines:
+                offset += len(line) + 1  # The next line starts after this one's newline
+                offsets.append(offset)
+            # Byte lengths are character lengths for ASCII
+            lengths.extend(map(len if buf.isascii() else char_len, lines))
+        return cls(data, offsets, lengths)
+    
+    def __len__(self):
+        return len(self.lengths)
+    
+    def __getitem__(self, i):
+        return bytes(memoryview(self.data)[self.offsets[i]:self.offsets[i + 1] - 1])
+    
+    def __iter__(self):
+        return chain.from_iterable(window.split(b'\n') for window in self.windows())
+    
+    def windows(self):
+        """Yield newline-aligned slices of the blob, each holding complete lines without the final newline"""
+        data = self.data
+        view = memoryview(data)
+        start = 0
+        while start < len(data):
+            end = data.find(b'\n', start + CHUNK_SIZE - 1)
+            if end < 0:
+                end = len(data) - 1
+            yield view[start:end].tobytes()
+            start = end + 1
+
+@contextmanager
+def map_file(filename):
+    """Memory-map a plain file read-only; yields None if the file can't be mapped"""
+    if not Path(filename).exists():
+        raise FileNotFoundError(f"File not found: {filename}")
+    
+    if filename.endswith(('.gz', '.zip')):
+        yield None
+        return
+    
+    with open(filename, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files, pipes and other special files
+            mm = None
+        if mm is None:
+            yield None
+            return
+        with mm:
+            advise_sequential(mm)
+            yield mm
+
+def iter_line_windows(mm, show_progress=False, window=CHUNK_SIZE, whole_file=True):
+    """Yield newline-aligned (start, end) windows over a mapped file, or over a line buffer if not whole_file"""
+    size = len(mm)
+    if whole_file and mm[size - 1:size] == b'\n':
+        # A file's final newline terminates its last line; line buffers already had it removed,
+        # so a newline at their end starts an empty last line
+        size -= 1
+    
+    start = 0
+    while True:
+        end = mm.find(b'\n', start + window, size) if start + window < size else -1
+        if end < 0:
+            end = size
+        yield start, end
+        if show_progress:
+            print(progress_bar(end, size), end='', flush=True)
+        if end >= size:
+            break
+        start = end + 1
+    if show_progress:
+        print()  # New line after progress
+
+def find_lines(buf, sub, start=0, end=None, haystack=None):
+    """Return the lines of a line buffer that contain sub, jumping between matches
+
+    haystack is searched instead of buf when given; it must keep buf's line offsets.
+    """
+    if end is None:
+        end = len(buf)
+    if haystack is None:
+        haystack = buf
+    found = []
+    pos = haystack.find(sub, start, end)
+    while pos >= 0:
+        line_start = max(haystack.rfind(b'\n', start, pos) + 1, start)
+        line_end = haystack.find(b'\n', pos, end)
+        if line_end < 0:
+            line_end = end
+        found.append(buf[line_start:line_end])
+        pos = haystack.find(sub, line_end + 1, end)
+    return found
+
+@lru_cache(maxsize=128)
+def compile_regex(pattern, flags=0):
+    """Compile a text pattern once per process, however many buffers or calls use it"""
+    return re.compile(pattern, flags)
+
+@lru_cache(maxsize=128)
+def compile_line_scanner(pattern, flags=0):
+    """Compile pattern for searching whole buffers; None if the pattern must run per line"""
+    # Anchors and lookarounds would see the neighbouring lines in a shared buffer
+    if not pattern.isascii() or any(token in pattern for token in ('^', '$', '\\A', '\\Z', '(?=', '(?!', '(?<')):
+        return None
+    try:
+        return re.compile(pattern.encode(), flags)
+    except re.error:
+        return None
+
+def scan_lines(mm, scanner, show_progress=False):
+    """Collect the lines of a line buffer matched by a scanner, jumping between matches"""
+    result = []
+    for start, end in iter_line_windows(mm, show_progress, whole_file=False):
+        lo = max(start - 1, 0)  # Windows start right after a newline
+        match = scanner.search(mm, start, end)
+        while match:
+            line_start = mm.rfind(b'\n', lo, match.start()) + 1
+            line_end = mm.find(b'\n', match.start(), end)
+            if line_end < 0:
+                line_end = end
+            if match.end() > line_end:
+                # The match reached across a line break; check those lines one by one
+                line_end = mm.find(b'\n', match.end(), end)
+                if line_end < 0:
+                    line_end = end
+                lines = mm[line_start:line_end].split(b'\n')
+                result += [line for line in lines if scanner.search(line)]
             else:
-                lines = [line.rstrip('\n\r') for line in f]
+                result.append(mm[line_start:line_end])
+            if line_end >= end:
+                break
+            match = scanner.search(mm, line_end + 1, end)
+    return result
+
+@lru_cache(maxsize=128)
+def compile_re2(pattern, case_insensitive, strict=False):
+    """Compile pattern with RE2; None if RE2 is missing or (unless strict) rejects it"""
+    if re2 is None:
+        return None
+    try:
+        return re2.compile(('(?i)' if case_insensitive else '') + pattern)
+    except re2.error:
+        if strict:
+            raise
+        return None  # e.g. backreferences or lookarounds, which RE2 doesn't support
+
+def compile_hyperscan(pattern, case_insensitive):
+    """Compile pattern into a Hyperscan database where ^ and $ match at line boundaries"""
+    # UTF8 and UCP give \w, \s and case folding the same Unicode meaning as re on str
+    flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    if case_insensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    db = hyperscan.Database()
+    db.compile(expressions=[pattern.encode('utf-8')], ids=[0], elements=1, flags=[flags])
+    return db
+
+def hyperscan_lines(db, buf, regex):
+    """Return the lines of a line buffer matched by regex, found through a Hyperscan database"""
+    if not buf.isascii():
+        try:
+            buf.decode('utf-8')
+        except UnicodeDecodeError:
+            # Hyperscan's UTF-8 mode is undefined on invalid input, so check every line with re
+            return [line for line in buf.split(b'\n')
+                    if regex.search(line.decode('utf-8', errors='surrogateescape'))]
+    found = []
+    line_end = -1
     
-    return lines
+    def on_match(pattern_id, start, end, flags, context):
+        nonlocal line_end
+        if end - 1 <= line_end:
+            return  # Line already checked
+        line_start = buf.rfind(b'\n', 0, end - 1) + 1
+        line_end = buf.find(b'\n', end - 1)
+        if line_end < 0:
+            line_end = len(buf)
+        line = buf[line_start:line_end]
+        # Patterns like a\sb can match across a newline, so confirm the match within the line
+        if regex.search(line.decode('utf-8', errors='surrogateescape')):
+            found.append(line)
+    
+    db.scan(buf, match_event_handler=on_match)
+    return found
 
-def clean_lines(lines, strip_whitespace=False, remove_empty=False):
-    """Clean lines by removing whitespace and empty entries"""
-    if strip_whitespace:
-        lines = [line.strip() for line in lines]
+def build_keyword_matcher(keywords):
+    """Return a predicate telling whether a line contains any of the keywords"""
+    if not keywords:
+        return lambda line: False
     
-    if remove_empty:
-        lines = [line for line in lines if line]
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word in keywords:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda line: next(automaton.iter(line), None) is not None
     
-    return lines
+    # Without pyahocorasick, an alternation of literals still matches in a single C-level pass
+    return re.compile('|'.join(map(re.escape, keywords))).search
+
+def fold_case(line):
+    """Lowercase a raw byte line the way str.lower() would"""
+    if line.isascii():
+        return line.lower()  # Only A-Z change, no decoding needed
+    return line.decode('utf-8', errors='surrogateescape').lower().encode('utf-8', errors='surrogateescape')
+
+def fold_case_lines(buf):
+    """Case-folded lines of a line buffer, lowering ASCII buffers in a single call"""
+    if buf.isascii():
+        return split_lines(buf.lower())
+    return [fold_case(line) for line in split_lines(buf)]
+
+def bucket_count(files):
+    """Number of hash buckets (a power of two) that keeps each bucket near BUCKET_SIZE"""
+    total = sum(os.path.getsize(f) for f in files if os.path.exists(f))
+    count = 1
+    while count * BUCKET_SIZE < total and count < MAX_BUCKETS:
+        count *= 2
+    return count
+
+def external_unique(files, case_insensitive, show_progress=False):
+    """Deduplicate files through hash-partitioned temporary buckets, yielding sorted lines"""
+    num_buckets = bucket_count(files)
+    spool_size = min(CHUNK_SIZE, SPOOL_BUDGET // num_buckets)
+    buckets = [tempfile.SpooledTemporaryFile(max_size=spool_size) for _ in range(num_buckets)]
+    try:
+        # Partition: equal lines (or case variants) always land in the same bucket
+        for fname in files:
+            print(f"📁 Processing: {fname}")
+            for buf in iter_line_buffers(fname, show_progress):
+                lines = split_lines(buf)
+                if num_buckets == 1:
+                    buckets[0].write(b'\n'.join(lines) + b'\n')
+                    continue
+                keys = fold_case_lines(buf) if case_insensitive else lines
+                parts = [[] for _ in range(num_buckets)]
+                for line, key in zip(lines, keys):
+                    parts[hash(key) & (num_buckets - 1)].append(line)
+                for bucket, part in zip(buckets, parts):
+                    if part:
+                        bucket.write(b'\n'.join(part) + b'\n')
+        
+        # Deduplicate and sort one bucket at a time, writing it back in place
+        for bucket in buckets:
+            bucket.seek(0)
+            lines = bucket.read().split(b'\n')
+            lines.pop()  # Trailing newline
+            if case_insensitive:
+                first_seen = {}
+                for line in lines:
+                    first_seen.setdefault(fold_case(line), line)
+                lines = sorted(first_seen.values())
+            else:
+                lines = sorted(set(lines))
+            if num_buckets == 1:
+                yield from lines
+                return
+            bucket.seek(0)
+            bucket.truncate()
+            if lines:
+                bucket.write(b'\n'.join(lines) + b'\n')
+            bucket.seek(0)
+        
+        # Buckets hold disjoint keys, so merging the sorted runs can't produce duplicates;
+        # compare without the newline, or lines with bytes below it would merge out of order
+        yield from (line[:-1] for line in heapq.merge(*buckets, key=lambda line: line[:-1]))
+    finally:
+        for bucket in buckets:
+            bucket.close()
+
+@lru_cache(maxsize=None)
+def gnu_sort():
+    """Path of GNU sort, or None if sort is missing or not the GNU coreutils one"""
+    path = shutil.which('sort')
+    if path is None:
+        return None
+    try:
+        version = subprocess.run([path, '--version'], capture_output=True, text=True).stdout
+    except OSError:
+        return None
+    return path if 'GNU' in version else None
+
+def sort_unique(files, reverse=False, show_progress=False):
+    """Yield the distinct lines of files in byte order, deduplicated and sorted by GNU sort -u"""
+    # Byte order under LC_ALL=C is code point order for UTF-8, the same order sorted() gives str
+    command = [gnu_sort(), '-u', f'--parallel={os.cpu_count() or 1}', '-S', '25%']
+    if reverse:
+        command.append('-r')
+    env = dict(os.environ, LC_ALL='C')
+    proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env)
+    try:
+        # sort only starts writing after end of input, so feeding it first can't deadlock
+        for fname in files:
+            print(f"📁 Processing: {fname}")
+            for buf in iter_line_buffers(fname, show_progress):
+                proc.stdin.write(buf + b'\n')
+        proc.stdin.close()
+        chunks = iter(lambda: proc.stdout.read(CHUNK_SIZE), b'')
+        yield from chain.from_iterable(buf.split(b'\n') for buf in align_lines(chunks))
+        if proc.wait() != 0:
+            raise RuntimeError(f"sort exited with status {proc.returncode}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+def delete_kernel(buf, delete_set, case_insensitive):
+    """Lines of a line buffer that are not in delete_set (compared case-folded with case_insensitive)"""
+    lines = split_lines(buf)
+    if not case_insensitive:
+        return [line for line in lines if line not in delete_set]
+    return [line for line, key in zip(lines, fold_case_lines(buf)) if key not in delete_set]
+
+def length_kernel(buf, min_len, max_len):
+    """Lines of a line buffer whose length is within [min_len, max_len]"""
+    lines = split_lines(buf)
+    if buf.isascii():
+        return [line for line in lines if min_len <= len(line) <= max_len]
+    return [line for line in lines if min_len <= char_len(line) <= max_len]
+
+def contains_kernel(buf, substring):
+    """Lines of a line buffer containing substring, compared case-insensitively"""
+    # A line break in substring would let a buffer-wide search match across lines
+    if substring.isascii() and buf.isascii() and '\n' not in substring and '\r' not in substring:
+        # bytes.lower() is exact for ASCII and keeps every offset, so search a lowered copy;
+        # jumping between matches only beats the per-line scan while matches are sparse
+        haystack = buf.lower()
+        sub = substring.encode()
+        if haystack.count(sub) * SPARSE_MATCHES <= buf.count(b'\n'):
+            return [line.decode() for line in find_lines(buf, sub, haystack=haystack)]
+    lines = buf.decode('utf-8', errors='surrogateescape').split('\n')
+    return [line for line in lines if substring in line.lower()]
+
+def regex_kernel(buf, pattern, flags):
+    """Lines of a line buffer matched by pattern"""
+    scanner = compile_line_scanner(pattern, flags)
+    if scanner is not None and buf.isascii():
+        # Let the C matcher skip over non-matching lines of the whole buffer
+        return scan_lines(buf, scanner)
+    regex = compile_regex(pattern, flags)
+    texts = buf.decode('utf-8', errors='surrogateescape').split('\n')
+    return [line for line, text in zip(split_lines(buf), texts) if regex.search(text)]
+
+def unique_chars_kernel(buf, min_unique):
+    """Lines of a line buffer with at least min_unique distinct characters (ignoring case)"""
+    lines = split_lines(buf)
+    if buf.isascii():
+        # bytes.lower() is exact for ASCII, and short lines can't reach the minimum
+        return [line for line in lines if len(line) >= min_unique and len(set(line.lower())) >= min_unique]
+    return [line for line in lines if len(set(line.decode('utf-8', errors='surrogateescape').lower())) >= min_unique]
+
+def run_kernel(filename, start, end, kernel, args):
+    """Worker: map the file again and run kernel over one byte range"""
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        advise_sequential(mm)
+        return kernel(normalize_newlines(mm[start:end]), *args)
+
+def filter_buffers(filename, kernel, args, jobs=1, show_progress=False):
+    """Iterate over kernel(buf, *args) results for the line buffers of a file, in worker processes if jobs > 1"""
+    if not Path(filename).exists():
+        raise FileNotFoundError(f"File not found: {filename}")
+    
+    ranges = None
+    if jobs > 1:
+        with map_file(filename) as mm:
+            if mm is not None:
+                window = min(CHUNK_SIZE, len(mm) // jobs + 1)
+                ranges = list(iter_line_windows(mm, window=window))
+    
+    if ranges is None:
+        batches = (kernel(buf, *args) for buf in iter_line_buffers(filename, show_progress))
+    else:
+        batches = run_kernel_pool(filename, kernel, args, ranges, jobs, show_progress)
+    return chain.from_iterable(batches)
+
+def run_kernel_pool(filename, kernel, args, ranges, jobs, show_progress=False):
+    """Yield kernel results for each byte range, computed by a pool of worker processes"""
+    # Ranges are newline-aligned, so workers never split a line; results keep file order.
+    # Only a couple of ranges per worker are in flight, so finished results never pile up.
+    remaining = iter(ranges)
+    with ProcessPoolExecutor(jobs) as pool:
+        pending = deque(pool.submit(run_kernel, filename, start, end, kernel, args)
+                        for start, end in islice(remaining, 2 * jobs))
+        done = 0
+        while pending:
+            result = pending.popleft().result()
+            for start, end in islice(remaining, 1):
+                pending.append(pool.submit(run_kernel, filename, start, end, kernel, args))
+            yield result
+            del result
+            done += 1
+            if show_progress:
+                print(progress_bar(done, len(ranges)), end='', flush=True)
+    if show_progress:
+        print()  # New line after progress
+
+def display_line(line):
+    """Printable form of a text or raw byte line, with undecodable bytes shown as U+FFFD"""
+    if isinstance(line, str):
+        line = line.encode('utf-8', errors='surrogateescape')
+    return line.decode('utf-8', errors='replace')
+
+def char_len(line):
+    """Length of a raw byte line in characters"""
+    return len(line) if line.isascii() else len(line.decode('utf-8', errors='surrogateescape'))
+
+def numeric_key(line):
+    """Sort key for numeric sorting: the line's value, or infinity if it isn't a number"""
+    if line.replace('.', '').replace('-', '').isdigit():
+        try:
+            return float(line)
+        except ValueError:
+            pass  # e.g. "1-2" or "1.2.3", which only look numeric
+    return INFINITY
 
 def sort_lines(lines, sort_type="alpha", reverse=False):
     """Sort lines by various criteria"""
@@ -97,203 +671,367 @@ def sort_lines(lines, sort_type="alpha", reverse=False):
     elif sort_type == "length":
         return sorted(lines, key=len, reverse=reverse)
     elif sort_type == "numeric":
-        try:
-            return sorted(lines, key=lambda x: float(x) if x.replace('.', '').replace('-', '').isdigit() else float('inf'), reverse=reverse)
-        except:
-            return sorted(lines, reverse=reverse)
+        return sorted(lines, key=numeric_key, reverse=reverse)
     return lines
 
-def transform_lines(lines, transform_type):
-    """Transform lines according to specified type"""
-    if transform_type == "lower":
-        return [line.lower() for line in lines]
-    elif transform_type == "upper":
-        return [line.upper() for line in lines]
-    elif transform_type == "capitalize":
-        return [line.capitalize() for line in lines]
-    elif transform_type == "reverse":
-        return [line[::-1] for line in lines]
-    return lines
+# Source templates for --transform, applied to an expression for the line
+TRANSFORMS = {
+    "lower": "{}.lower()",
+    "upper": "{}.upper()",
+    "capitalize": "{}.capitalize()",
+    "reverse": "{}[::-1]",
+}
 
-def filter_by_content(lines, filter_type):
-    """Filter lines by content type"""
-    result = []
-    for line in lines:
-        if filter_type == "digits":
-            if line.isdigit():
-                result.append(line)
-        elif filter_type == "alpha":
-            if line.isalpha():
-                result.append(line)
-        elif filter_type == "has_special":
-            if not line.isalnum():
-                result.append(line)
-        elif filter_type == "has_upper":
-            if any(c.isupper() for c in line):
-                result.append(line)
-        elif filter_type == "has_number":
-            if any(c.isdigit() for c in line):
-                result.append(line)
-    return result
+def has_upper(line):
+    """Check whether a line contains an uppercase character"""
+    if line.isascii():
+        return line != line.lower()  # Only A-Z change, all in C
+    return any(c.isupper() for c in line)
+
+def has_number(line):
+    """Check whether a line contains a digit"""
+    if line.isascii():
+        return ASCII_DIGIT.search(line) is not None
+    return any(c.isdigit() for c in line)
+
+# Per-line predicates for --content-filter
+CONTENT_FILTERS = {
+    "digits": str.isdigit,
+    "alpha": str.isalpha,
+    "has_special": lambda line: not line.isalnum(),
+    "has_upper": has_upper,
+    "has_number": has_number,
+}
+
+@lru_cache(maxsize=None)
+def build_pipeline(decode, strip_whitespace, remove_empty, transform_type, filter_type):
+    """Generate one function applying decoding, cleaning, transforming and content filtering to lines"""
+    # Every per-line step is fused into a single expression, so each line goes through one generator
+    expr = "line.decode('utf-8', errors='surrogateescape')" if decode else "line"
+    if strip_whitespace:
+        expr += ".strip()"
+    if transform_type in TRANSFORMS:
+        expr = TRANSFORMS[transform_type].format(expr)
+    
+    source = ["def pipeline(lines):"]
+    if expr != "line":
+        source.append(f"    lines = ({expr} for line in lines)")
+    # Transforms never change whether a line is empty, so empties can be dropped after them
+    if remove_empty:
+        source.append("    lines = filter(None, lines)")
+    if filter_type:
+        source.append("    lines = filter(keep, lines)")
+    source.append("    return lines")
+    
+    namespace = {"keep": CONTENT_FILTERS.get(filter_type, lambda line: False)}
+    exec(compile("\n".join(source), "<pipeline>", "exec"), namespace)
+    return namespace["pipeline"]
 
 def get_statistics(lines):
-    """Get detailed statistics about the wordlist"""
+    """Get detailed statistics about the wordlist (a LineSet)"""
     if not lines:
         return "No data to analyze."
     
-    lengths = [len(line) for line in lines]
-    unique_lines = set(lines)
+    lengths = lines.lengths
+    shortest = min(lengths)
+    longest = max(lengths)
+    # Distinct fingerprints are smaller than a second copy of every long line (with xxhash)
+    unique_count = len(set(map(fingerprint, lines)))
+    
+    # Character classes are counted one window of lines at a time, in C for ASCII windows
+    with_numbers = with_upper = with_special = 0
+    for window in lines.windows():
+        if window.isascii():
+            with_numbers += len(LINES_WITH_NUMBER.findall(window))
+            with_upper += len(LINES_WITH_UPPER.findall(window))
+            with_special += len(LINES_WITH_SPECIAL.findall(window))
+        else:
+            texts = window.decode('utf-8', errors='surrogateescape').split('\n')
+            with_numbers += len([l for l in texts if any(c.isdigit() for c in l)])
+            with_upper += len([l for l in texts if any(c.isupper() for c in l)])
+            with_special += len([l for l in texts if not l.isalnum()])
     
     stats = f"""
 📊 Wordlist Statistics:
 ═══════════════════════
 Total lines: {len(lines):,}
-Unique entries: {len(unique_lines):,}
-Duplicates: {len(lines) - len(unique_lines):,}
+Unique entries: {unique_count:,}
+Duplicates: {len(lines) - unique_count:,}
 
 📏 Length Analysis:
-Shortest word: {min(lengths)} chars ("{min(lines, key=len)}")
-Longest word: {max(lengths)} chars ("{max(lines, key=len)}")
-Average length: {statistics.mean(lengths):.2f} chars
+Shortest word: {shortest} chars ("{display_line(lines[lengths.index(shortest)])}")
+Longest word: {longest} chars ("{display_line(lines[lengths.index(longest)])}")
+Average length: {sum(lengths) / len(lengths):.2f} chars
 Median length: {statistics.median(lengths):.2f} chars
 
 🔤 Character Analysis:
-Lines with numbers: {len([l for l in lines if any(c.isdigit() for c in l)]):,}
-Lines with uppercase: {len([l for l in lines if any(c.isupper() for c in l)]):,}
-Lines with special chars: {len([l for l in lines if not l.isalnum()]):,}
+Lines with numbers: {with_numbers:,}
+Lines with uppercase: {with_upper:,}
+Lines with special chars: {with_special:,}
 """
     return stats
 
-def write_output(lines, output_file, preview=False, dry_run=False):
-    """Write output with various options"""
+def encode_batch(batch):
+    """Join a batch of text or raw byte lines into newline-terminated bytes"""
+    if isinstance(batch[0], bytes):
+        return b"\n".join(batch) + b"\n"
+    return ("\n".join(batch) + "\n").encode("utf-8", errors="surrogateescape")
+
+def same_file(path, other):
+    """Whether two paths name the same existing file"""
+    try:
+        return os.path.samefile(path, other)
+    except OSError:
+        return False
+
+@contextmanager
+def open_output(output_file, inputs=(), buffering=OPEN_BUFFERING):
+    """Open output_file for binary writing, without truncating it while it is still an input being read"""
+    if not any(same_file(output_file, fname) for fname in inputs):
+        with open(output_file, "wb", buffering=buffering) as out:
+            yield out
+        return
+    
+    # Inputs are read lazily, so write next to the file and swap it in once everything is read
+    directory = os.path.dirname(os.path.abspath(output_file))
+    tmp = tempfile.NamedTemporaryFile("wb", buffering=buffering, dir=directory, prefix=".wordcrunch-", delete=False)
+    try:
+        with tmp:
+            yield tmp
+        shutil.copymode(output_file, tmp.name)
+        os.replace(tmp.name, output_file)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+def write_output(lines, output_file, preview=False, dry_run=False, inputs=()):
+    """Write output with various options, consuming lines as a stream; inputs are the files lines come from"""
+    lines = iter(lines)
+    
     if dry_run:
-        print(f"🔍 DRY RUN: Would write {len(lines):,} lines to {'stdout' if not output_file else output_file}")
+        count = sum(1 for _ in lines)
+        print(f"🔍 DRY RUN: Would write {count:,} lines to {'stdout' if not output_file else output_file}")
         return
     
     if preview:
-        print(f"📋 Preview (first 10 lines of {len(lines):,} total):")
+        preview_lines = list(islice(lines, 10))
+        total = len(preview_lines) + sum(1 for _ in lines)
+        print(f"📋 Preview (first 10 lines of {total:,} total):")
         print("-" * 50)
-        for i, line in enumerate(lines[:10]):
-            print(f"{i+1:2d}: {line}")
-        if len(lines) > 10:
-            print(f"... and {len(lines) - 10:,} more lines")
+        for i, line in enumerate(preview_lines):
+            print(f"{i+1:2d}: {display_line(line)}")
+        if total > 10:
+            print(f"... and {total - 10:,} more lines")
         return
     
+    batches = iter(lambda: list(islice(lines, WRITE_BATCH)), [])
     if output_file:
-        with open(output_file, "w", encoding="utf-8") as out:
-            for line in lines:
-                out.write(line + "\n")
-        print(f"✅ Written {len(lines):,} lines to {output_file}")
+        count = 0
+        with open_output(output_file, inputs) as out:
+            for batch in batches:
+                out.write(encode_batch(batch))
+                count += len(batch)
+        print(f"✅ Written {count:,} lines to {output_file}")
     else:
-        for line in lines:
-            print(line)
+        sys.stdout.flush()
+        for batch in batches:
+            sys.stdout.buffer.write(encode_batch(batch))
+        sys.stdout.buffer.flush()
 
-def merge_files(files, unique_only, case_insensitive, output_file, **kwargs):
+def merge_lines(files, unique_only, case_insensitive, show_progress=False):
+    """Concatenate files in order, optionally keeping only the first of each duplicate"""
     seen = set()
-    result = []
     
     for fname in files:
         print(f"📁 Processing: {fname}")
-        lines = read_file_lines(fname, kwargs.get('progress', False))
+        if not unique_only:
+            yield from iter_lines_bytes(fname, show_progress)
+            continue
         
-        for line in lines:
-            compare_line = line.lower() if case_insensitive else line
-            
-            if not unique_only or compare_line not in seen:
-                result.append(line)
-                seen.add(compare_line)
+        for buf in iter_line_buffers(fname, show_progress):
+            lines = split_lines(buf)
+            keys = fold_case_lines(buf) if case_insensitive else lines
+            # Keys are 128-bit fingerprints with xxhash, else the (case-folded) lines themselves
+            for line, key in zip(lines, map(fingerprint, keys)):
+                if key not in seen:
+                    seen.add(key)
+                    yield line
+
+def copy_file(src, out, size):
+    """Copy size bytes of src to out in the kernel where possible"""
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(out.fileno(), src.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except (AttributeError, OSError):
+        # No sendfile, or not to this kind of file: finish with a buffered copy
+        src.seek(offset)
+        shutil.copyfileobj(src, out, OPEN_BUFFERING)
+
+def concatenate_files(files, output_file, show_progress=False):
+    """Write the lines of files to output_file unchanged, copying whole files where the bytes already match"""
+    count = 0
+    with open_output(output_file, files, buffering=0) as out:
+        for fname in files:
+            print(f"📁 Processing: {fname}")
+            with map_file(fname) as mm:
+                # A file copies as-is unless it has CR line endings to strip (or is compressed/empty)
+                if mm is not None and mm.find(b'\r') < 0:
+                    for start, end in iter_line_windows(mm, show_progress):
+                        count += mm[start:end].count(b'\n') + 1
+                    with open(fname, 'rb') as src:
+                        copy_file(src, out, len(mm))
+                    if mm[-1:] != b'\n':
+                        out.write(b'\n')
+                    continue
+            for buf in iter_line_buffers(fname, show_progress):
+                out.write(buf + b'\n')
+                count += buf.count(b'\n') + 1
+    print(f"✅ Written {count:,} lines to {output_file}")
+
+def merge_files(files, unique_only, case_insensitive, output_file, low_memory=False, **kwargs):
+    for fname in files:
+        if not Path(fname).exists():
+            raise FileNotFoundError(f"File not found: {fname}")
+    
+    # Nothing to change in the lines themselves: copy the files instead of handling each line
+    passthrough = not any(kwargs.get(op) for op in ('strip', 'remove_empty', 'transform', 'content_filter', 'sort'))
+    if not unique_only and passthrough and output_file and not kwargs.get('preview') and not kwargs.get('dry_run'):
+        concatenate_files(files, output_file, kwargs.get('progress', False))
+        return
+    
+    # Plain --unique --sort alpha is exactly what sort -u does, with external memory and threads
+    sort_only = not any(kwargs.get(op) for op in ('strip', 'remove_empty', 'transform', 'content_filter'))
+    if unique_only and not case_insensitive and kwargs.get('sort') == 'alpha' and sort_only and gnu_sort():
+        result = sort_unique(files, kwargs.get('reverse_sort', False), kwargs.get('progress', False))
+        kwargs['sort'] = None
+    elif unique_only and low_memory:
+        # Bounded-memory dedup through temporary buckets; output comes back sorted
+        result = external_unique(files, case_insensitive, kwargs.get('progress', False))
+    else:
+        result = merge_lines(files, unique_only, case_insensitive, kwargs.get('progress', False))
     
     result = apply_common_operations(result, **kwargs)
-    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'))
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=files)
 
 def delete_entries(from_file, delete_file, case_insensitive, output_file, **kwargs):
     delete_set = set()
     
     # Load deletion list
-    delete_lines = read_file_lines(delete_file)
-    for line in delete_lines:
-        compare_line = line.lower() if case_insensitive else line
-        delete_set.add(compare_line)
+    for buf in iter_line_buffers(delete_file):
+        delete_set.update(fold_case_lines(buf) if case_insensitive else split_lines(buf))
     
     # Process main file
-    main_lines = read_file_lines(from_file, kwargs.get('progress', False))
-    result = []
-    
-    for line in main_lines:
-        compare_line = line.lower() if case_insensitive else line
-        if compare_line not in delete_set:
-            result.append(line)
+    result = filter_buffers(from_file, delete_kernel, (delete_set, case_insensitive), 1, kwargs.get('progress', False))
     
     result = apply_common_operations(result, **kwargs)
-    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'))
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=(from_file, delete_file))
 
 def filter_length(file, min_len, max_len, output_file, **kwargs):
-    lines = read_file_lines(file, kwargs.get('progress', False))
-    result = [line for line in lines if min_len <= len(line) <= max_len]
+    result = filter_buffers(file, length_kernel, (min_len, max_len), kwargs.get('jobs', 1), kwargs.get('progress', False))
     
     result = apply_common_operations(result, **kwargs)
-    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'))
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=(file,))
 
 def filter_contains(file, substring, case_insensitive, output_file, **kwargs):
-    lines = read_file_lines(file, kwargs.get('progress', False))
+    jobs = kwargs.get('jobs', 1)
+    show_progress = kwargs.get('progress', False)
+    sub = substring.encode('utf-8')
     
     if case_insensitive:
-        substring = substring.lower()
-        result = [line for line in lines if substring in line.lower()]
+        result = filter_buffers(file, contains_kernel, (substring.lower(),), jobs, show_progress)
+    elif sub and b'\n' not in sub and b'\r' not in sub:
+        # Jump from match to match inside whole buffers instead of testing every line
+        result = filter_buffers(file, find_lines, (sub,), jobs, show_progress)
     else:
-        result = [line for line in lines if substring in line]
+        result = (line for line in iter_lines_bytes(file, show_progress) if sub in line)
     
     result = apply_common_operations(result, **kwargs)
-    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'))
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=(file,))
 
-def filter_regex(file, pattern, case_insensitive, output_file, **kwargs):
-    flags = re.IGNORECASE if case_insensitive else 0
-    regex = re.compile(pattern, flags)
+def filter_contains_any(file, keywords_file, case_insensitive, output_file, **kwargs):
+    keywords = {line.lower() if case_insensitive else line for line in read_file_lines(keywords_file) if line}
+    matches = build_keyword_matcher(sorted(keywords))
     
     lines = read_file_lines(file, kwargs.get('progress', False))
-    result = [line for line in lines if regex.search(line)]
+    if case_insensitive:
+        result = (line for line in lines if matches(line.lower()))
+    else:
+        result = filter(matches, lines)
+    
+    result = apply_common_operations(result, **kwargs)
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=(file, keywords_file))
+
+def filter_regex(file, pattern, case_insensitive, output_file, regex_engine='auto', **kwargs):
+    show_progress = kwargs.get('progress', False)
+    regex = None
+    if regex_engine in ('auto', 're2'):
+        regex = compile_re2(pattern, case_insensitive, strict=regex_engine == 're2')
+    
+    if regex_engine == 'hyperscan':
+        regex = compile_regex(pattern, re.IGNORECASE if case_insensitive else 0)
+        db = compile_hyperscan(pattern, case_insensitive)
+        buffers = iter_line_buffers(file, show_progress)
+        result = chain.from_iterable(hyperscan_lines(db, buf, regex) for buf in buffers)
+    elif regex is not None:
+        def matches(line):
+            try:
+                return regex.search(line)
+            except UnicodeEncodeError:
+                # RE2 only takes valid UTF-8; search undecodable bytes as U+FFFD
+                return regex.search(display_line(line))
+        result = filter(matches, read_file_lines(file, show_progress))
+    else:
+        flags = re.IGNORECASE if case_insensitive else 0
+        compile_regex(pattern, flags)  # Report a bad pattern before reading anything
+        result = filter_buffers(file, regex_kernel, (pattern, flags), kwargs.get('jobs', 1), show_progress)
     
     result = apply_common_operations(result, **kwargs)
-    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'))
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=(file,))
 
 def filter_starts_ends(file, starts_with, ends_with, case_insensitive, output_file, **kwargs):
     lines = read_file_lines(file, kwargs.get('progress', False))
-    result = []
+    check_starts = starts_with.lower() if case_insensitive and starts_with else starts_with
+    check_ends = ends_with.lower() if case_insensitive and ends_with else ends_with
     
-    for line in lines:
+    def matches(line):
         check_line = line.lower() if case_insensitive else line
-        check_starts = starts_with.lower() if case_insensitive and starts_with else starts_with
-        check_ends = ends_with.lower() if case_insensitive and ends_with else ends_with
-        
         if starts_with and not check_line.startswith(check_starts):
-            continue
+            return False
         if ends_with and not check_line.endswith(check_ends):
-            continue
-        result.append(line)
+            return False
+        return True
+    
+    result = filter(matches, lines)
     
     result = apply_common_operations(result, **kwargs)
-    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'))
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=(file,))
 
 def filter_unique_chars(file, min_unique, output_file, **kwargs):
-    lines = read_file_lines(file, kwargs.get('progress', False))
-    result = [line for line in lines if len(set(line.lower())) >= min_unique]
+    result = filter_buffers(file, unique_chars_kernel, (min_unique,), kwargs.get('jobs', 1), kwargs.get('progress', False))
     
     result = apply_common_operations(result, **kwargs)
-    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'))
+    write_output(result, output_file, kwargs.get('preview'), kwargs.get('dry_run'), inputs=(file,))
 
 def apply_common_operations(lines, **kwargs):
     """Apply common operations like cleaning, sorting, transforming"""
-    # Clean
-    if kwargs.get('strip') or kwargs.get('remove_empty'):
-        lines = clean_lines(lines, kwargs.get('strip'), kwargs.get('remove_empty'))
+    if not any(kwargs.get(op) for op in ('strip', 'remove_empty', 'transform', 'content_filter', 'sort')):
+        return lines
     
-    # Transform
-    if kwargs.get('transform'):
-        lines = transform_lines(lines, kwargs['transform'])
+    # Raw byte lines only need decoding once an operation works on text
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        return []
+    lines = chain((first,), lines)
     
-    # Filter by content type
-    if kwargs.get('content_filter'):
-        lines = filter_by_content(lines, kwargs['content_filter'])
+    # Clean, transform and filter by content type in one pass
+    pipeline = build_pipeline(isinstance(first, bytes), bool(kwargs.get('strip')), bool(kwargs.get('remove_empty')),
+                              kwargs.get('transform'), kwargs.get('content_filter'))
+    lines = pipeline(lines)
     
     # Sort
     if kwargs.get('sort'):
@@ -302,7 +1040,7 @@ def apply_common_operations(lines, **kwargs):
     return lines
 
 def show_statistics(file, **kwargs):
-    lines = read_file_lines(file, kwargs.get('progress', False))
+    lines = LineSet.from_file(file, kwargs.get('progress', False))
     print(get_statistics(lines))
 
 def main():
@@ -325,6 +1063,7 @@ def main():
     parser.add_argument('--preview', action='store_true', help='Show first 10 lines only')
     parser.add_argument('--dry-run', action='store_true', help='Show what would happen without doing it')
     parser.add_argument('--progress', action='store_true', help='Show progress bar for large files')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Worker processes for filter commands (default: 1)')
     
     subparsers = parser.add_subparsers(dest="command", help='Available commands')
     
@@ -332,6 +1071,8 @@ def main():
     merge_parser = subparsers.add_parser("merge", help="Merge multiple wordlists")
     merge_parser.add_argument("files", nargs="+", help="Files to merge")
     merge_parser.add_argument("--unique", action="store_true", help="Remove duplicates")
+    merge_parser.add_argument("--low-memory", action="store_true",
+                              help="With --unique: dedup through temporary files (output is sorted)")
     
     # Delete command
     delete_parser = subparsers.add_parser("delete", help="Remove entries from one list based on another")
@@ -349,10 +1090,17 @@ def main():
     contains_parser.add_argument("file", help="Input file")
     contains_parser.add_argument("substring", help="Substring to find")
     
+    # Contains-any command
+    contains_any_parser = subparsers.add_parser("contains-any", help="Filter by any of several substrings")
+    contains_any_parser.add_argument("file", help="Input file")
+    contains_any_parser.add_argument("--keywords", required=True, help="File with one substring per line")
+    
     # Regex command
     regex_parser = subparsers.add_parser("regex", help="Filter by regex pattern")
     regex_parser.add_argument("file", help="Input file")
     regex_parser.add_argument("pattern", help="Regex pattern")
+    regex_parser.add_argument("--regex-engine", choices=['auto', 're', 're2', 'hyperscan'], default='auto',
+                              help='Regex engine (auto: re2 when installed, otherwise re)')
     
     # Starts/Ends command
     starts_ends_parser = subparsers.add_parser("starts-ends", help="Filter by prefix/suffix")
@@ -375,20 +1123,29 @@ def main():
         parser.print_help()
         return
     
-    # Convert args to kwargs
-    kwargs = vars(args)
+    if args.command == "regex":
+        installed = {'re2': re2, 'hyperscan': hyperscan}
+        if args.regex_engine in installed and installed[args.regex_engine] is None:
+            parser.error(f"regex engine '{args.regex_engine}' is not installed")
+    
+    # Forward the shared options as kwargs; command arguments are passed explicitly
+    common_options = ('sort', 'reverse_sort', 'strip', 'remove_empty', 'transform',
+                      'content_filter', 'preview', 'dry_run', 'progress', 'jobs')
+    kwargs = {key: value for key, value in vars(args).items() if key in common_options}
     
     try:
         if args.command == "merge":
-            merge_files(args.files, args.unique, args.case_insensitive, args.output, **kwargs)
+            merge_files(args.files, args.unique, args.case_insensitive, args.output, args.low_memory, **kwargs)
         elif args.command == "delete":
             delete_entries(args.from_file, args.delete_file, args.case_insensitive, args.output, **kwargs)
         elif args.command == "filter-length":
             filter_length(args.file, args.min_len, args.max_len, args.output, **kwargs)
         elif args.command == "contains":
             filter_contains(args.file, args.substring, args.case_insensitive, args.output, **kwargs)
+        elif args.command == "contains-any":
+            filter_contains_any(args.file, args.keywords, args.case_insensitive, args.output, **kwargs)
         elif args.command == "regex":
-            filter_regex(args.file, args.pattern, args.case_insensitive, args.output, **kwargs)
+            filter_regex(args.file, args.pattern, args.case_insensitive, args.output, args.regex_engine, **kwargs)
         elif args.command == "starts-ends":
             filter_starts_ends(args.file, args.starts_with, args.ends_with, args.case_insensitive, args.output, **kwargs)
         elif args.command == "unique-chars":